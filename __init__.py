@@ -24,7 +24,19 @@ from .utilities.logging import setup_logger, update_logger
 # Globals
 logger = logging.getLogger(__name__)
 
+# Guards against redundant register/unregister cycles, e.g. when the addon
+# gets re-enabled or reloaded within the same session
+_is_registered = False
+
 def register():
+    global _is_registered
+    if _is_registered:
+        logger.debug("Addon is already registered, skipping")
+        return
+
+    # Set right away so a registration that fails halfway can still be torn
+    # down on disable, unregistering never-registered classes is guarded
+    _is_registered = True
 
     # Setup root logger
     setup_logger(logger)
@@ -56,9 +68,21 @@ def register():
 
 
 def unregister():
-    if global_data.registered:
-        unregister_full()
+    global _is_registered
+    if not _is_registered:
+        return
+
+    try:
+        if global_data.registered:
+            unregister_full()
 
-    unregister_base()
+        unregister_base()
+    finally:
+        # Release the selection texture even if unregistering raises,
+        # leaking it across reload cycles holds on to GPU memory
+        if global_data.offscreen:
+            global_data.offscreen.free()
+            global_data.offscreen = None
 
-    cleanse_modules(__package__)
+        cleanse_modules(__package__)
+        _is_registered = False
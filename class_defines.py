@@ -415,6 +415,9 @@ def slvs_entity_pointer(cls, name, **kwargs):
     def setter(self, entity):
         index = entity.slvs_index if entity else -1
         setattr(self, index_prop, index)
+        # Rewriting a pointer changes the dependency graph, e.g. through
+        # replace(use_self=True) while trimming
+        _invalidate_deps_cache()
 
     setattr(cls, name, setter)
 
@@ -1092,6 +1095,11 @@ class SlvsLine2D(SlvsGenericEntity, PropertyGroup, Entity2D):
 
         return retval
 
+    def bbox(self):
+        """Returns the axis aligned bounding box of the line as (xmin, ymin, xmax, ymax)"""
+        (x1, y1), (x2, y2) = self.p1.co, self.p2.co
+        return (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+
     def replace_point(self, old, new):
         for ptr in ("p1", "p2"):
             if old != getattr(self, ptr):
@@ -1492,6 +1500,12 @@ class SlvsArc(SlvsGenericEntity, PropertyGroup, Entity2D):
 
         return retval
 
+    def bbox(self):
+        """Returns a conservative axis aligned bounding box of the arc as
+        (xmin, ymin, xmax, ymax), based on the full circle around the centerpoint"""
+        (x, y), r = self.ct.co, self.radius
+        return (x - r, y - r, x + r, y + r)
+
     def replace(self, context, p1, p2, use_self=False):
         if use_self:
             self.p1 = p1
@@ -1710,6 +1724,11 @@ class SlvsCircle(SlvsGenericEntity, PropertyGroup, Entity2D):
         retval = self.radius * angle
         return retval
 
+    def bbox(self):
+        """Returns the axis aligned bounding box of the circle as (xmin, ymin, xmax, ymax)"""
+        (x, y), r = self.ct.co, self.radius
+        return (x - r, y - r, x + r, y + r)
+
 
 slvs_entity_pointer(SlvsCircle, "nm")
 slvs_entity_pointer(SlvsCircle, "ct")
@@ -1738,6 +1757,13 @@ def update_pointers(scene, index_old, index_new):
     scene.sketcher.purge_stale_data()
 
 
+def _invalidate_deps_cache():
+    # NOTE: Import locally to avoid a circular module dependency
+    from .utilities.data_handling import invalidate_deps_cache
+
+    invalidate_deps_cache()
+
+
 class SlvsEntities(PropertyGroup):
     """Holds all Solvespace Entities"""
     # NOTE: currently limited to 16 items!
@@ -1792,6 +1818,7 @@ class SlvsEntities(PropertyGroup):
         # TODO: handle this case better
         assert local_index < math.pow(2, 20)
         entity.slvs_index = type_index << 20 | local_index
+        _invalidate_deps_cache()
 
     @staticmethod
     def _breakdown_index(index: int):
@@ -1840,29 +1867,36 @@ class SlvsEntities(PropertyGroup):
 
         Arguments:
             index: The global index of the entity.
+
+        Returns:
+            int: The previous global index of the entity that was moved into
+                the freed slot, or None if no entity had to be relocated.
         """
         assert isinstance(index, int)
 
         if self.get(index).origin:
-            return
+            return None
 
         entity_list, i = self._get_list_and_index(index)
         entity_list.remove(i)
+        _invalidate_deps_cache()
 
         # Put last item to removed index and update all pointers to it
         last_index = len(entity_list) - 1
 
         if last_index < 0:
-            return
+            return None
         if i > last_index:
-            return
+            return None
 
         if not i == last_index:  # second last item was deleted
             entity_list.move(last_index, i)
 
         new_item = entity_list[i]
-        update_pointers(bpy.context.scene, new_item.slvs_index, index)
+        index_old = new_item.slvs_index
+        update_pointers(bpy.context.scene, index_old, index)
         new_item.slvs_index = index
+        return index_old
 
     def add_point_3d(
         self, co: Union[Tuple[float, float, float], Vector]
@@ -2124,7 +2158,14 @@ line = (SlvsLine3D, SlvsLine2D)
 curve = (SlvsCircle, SlvsArc)
 segment = (*line, *curve)
 
+# Frozenset counterparts of the type tuples above, for fast membership tests
+point_types = frozenset(point)
+line_types = frozenset(line)
+curve_types = frozenset(curve)
+segment_types = frozenset(segment)
+
 ENTITY_PROP_NAMES = ("entity1", "entity2", "entity3", "entity4")
+ENTITY_INDEX_PROP_NAMES = tuple(name + "_i" for name in ENTITY_PROP_NAMES)
 
 
 class GenericConstraint:
@@ -2389,10 +2430,10 @@ class SlvsEqual(GenericConstraint, PropertyGroup):
         func = None
         set_wp = False
 
-        if all([type(e) in line for e in (e1, e2)]):
+        if all([type(e) in line_types for e in (e1, e2)]):
             func = solvesys.addEqualLength
             set_wp = True
-        elif all([type(e) in curve for e in (e1, e2)]):
+        elif all([type(e) in curve_types for e in (e1, e2)]):
             func = solvesys.addEqualRadius
         else:
             # TODO: Do a proper check to see if there's really one Arc and one Line
@@ -3281,15 +3322,12 @@ slvs_entity_pointer(SlvsRatio, "sketch")
 
 class SlvsConstraints(PropertyGroup):
 
-    _dimensional_constraints = (
+    _constraints = (
+        SlvsCoincident,
+        SlvsEqual,
         SlvsDistance,
         SlvsAngle,
         SlvsDiameter,
-    )
-
-    _geometric_constraints = (
-        SlvsCoincident,
-        SlvsEqual,
         SlvsParallel,
         SlvsHorizontal,
         SlvsVertical,
@@ -3297,34 +3335,32 @@ class SlvsConstraints(PropertyGroup):
         SlvsMidpoint,
         SlvsPerpendicular,
         SlvsRatio,
+        # SlvsSymmetric,
     )
 
-    _constraints = (
-        SlvsCoincident,
-        SlvsEqual,
+    _dimensional_constraints = (
         SlvsDistance,
         SlvsAngle,
         SlvsDiameter,
-        SlvsParallel,
-        SlvsHorizontal,
-        SlvsVertical,
-        SlvsTangent,
-        SlvsMidpoint,
-        SlvsPerpendicular,
-        SlvsRatio,
-        # SlvsSymmetric,
+    )
+
+    # Everything that isn't dimensional, derived so the full listing above
+    # stays the single source of truth
+    _geometric_constraints = tuple(
+        cls
+        for cls in _constraints
+        if cls not in (SlvsDistance, SlvsAngle, SlvsDiameter)
     )
 
     __annotations__ = {
         cls.type.lower(): CollectionProperty(type=cls) for cls in _constraints
     }
 
+    _cls_from_type_map = {cls.type: cls for cls in _constraints}
+
     @classmethod
     def cls_from_type(cls, type: str):
-        for constraint in cls._constraints:
-            if type == constraint.type:
-                return constraint
-        return None
+        return cls._cls_from_type_map.get(type)
 
     def new_from_type(self, type: str) -> GenericConstraint:
         """Create a constraint by type.
@@ -3334,6 +3370,7 @@ class SlvsConstraints(PropertyGroup):
         """
         name = type.lower()
         constraint_list = getattr(self, name)
+        _invalidate_deps_cache()
         return constraint_list.add()
 
     def get_lists(self):
@@ -3386,6 +3423,7 @@ class SlvsConstraints(PropertyGroup):
         """
         i = self.get_index(constr)
         self.get_list(constr.type).remove(i)
+        _invalidate_deps_cache()
 
     @property
     def dimensional(self):
@@ -3422,7 +3460,7 @@ class SlvsConstraints(PropertyGroup):
             SlvsCoincident: The created constraint.
         """
 
-        if all([type(e) in point for e in (entity1, entity2)]):
+        if all([type(e) in point_types for e in (entity1, entity2)]):
             # TODO: Implicitly merge points
             return
 
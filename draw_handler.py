@@ -2,7 +2,7 @@ import logging
 
 import bpy, gpu, bgl
 from bpy.types import Context, Operator
-from bpy.utils import register_class, unregister_class
+from bpy.utils import register_classes_factory
 
 from . import global_data
 from .utilities.preferences import use_experimental
@@ -105,10 +105,13 @@ def startup_cb(*args):
     bpy.ops.view3d.slvs_register_draw_cb()
     return None
 
+_register, _unregister = register_classes_factory(
+    (View3D_OT_slvs_register_draw_cb, View3D_OT_slvs_unregister_draw_cb)
+)
+
 def register():
-    register_class(View3D_OT_slvs_register_draw_cb)
-    register_class(View3D_OT_slvs_unregister_draw_cb)
-    
+    _register()
+
     bpy.app.timers.register(startup_cb, first_interval=1, persistent=True)
 
 def unregister():
@@ -116,5 +119,4 @@ def unregister():
     if handle:
         bpy.types.SpaceView3D.draw_handler_remove(handle, "WINDOW")
 
-    unregister_class(View3D_OT_slvs_unregister_draw_cb)
-    unregister_class(View3D_OT_slvs_register_draw_cb)
+    _unregister()
@@ -318,10 +318,10 @@ class VIEW3D_GT_slvs_distance(Gizmo, ConstraintGizmoGeneric):
         points_local = []
         points_local.append(get_local(entity1))
 
-        if type(entity2) in class_defines.point:
+        if type(entity2) in class_defines.point_types:
             points_local.append(get_local(entity2))
 
-        elif type(entity2) in class_defines.line:
+        elif type(entity2) in class_defines.line_types:
             line_points = (get_local(entity2.p1), get_local(entity2.p2))
             line_points_side = [pos.y - offset > 0 for pos in line_points]
 
@@ -665,11 +665,13 @@ class ConstraintGenericGGT:
         return context.scene.sketcher.constraints.get_list(self.type)
 
     def setup(self, context):
-        for c in self._list_from_type(context):
+        # The local index is the constraint's position in its collection,
+        # get_index() would scan the collection per constraint
+        for index, c in enumerate(self._list_from_type(context)):
             if not c.is_active(context.scene.sketcher.active_sketch):
                 continue
             gz = self.gizmos.new(self.gizmo_type)
-            gz.index = context.scene.sketcher.constraints.get_index(c)
+            gz.index = index
 
             set_gizmo_colors(gz, c.failed)
 
@@ -715,11 +717,12 @@ class VIEW3D_GGT_slvs_diameter(GizmoGroup, ConstraintGenericGGT):
     gizmo_type = VIEW3D_GT_slvs_diameter.bl_idname
 
 def iter_dimenional_constraints(context):
+    """Yield (constraint, local index) pairs of all dimensional constraints"""
     ssc = context.scene.sketcher.constraints
     collections = [ssc.distance, ssc.diameter, ssc.angle]
     for coll in collections:
-        for c in coll:
-            yield c
+        for index, c in enumerate(coll):
+            yield c, index
 
 class VIEW3D_GGT_slvs_constraint(GizmoGroup):
     bl_idname = GizmoGroups.Constraint
@@ -736,16 +739,16 @@ class VIEW3D_GGT_slvs_constraint(GizmoGroup):
     def setup(self, context):
         theme = functions.get_prefs().theme_settings
 
+        # Carry the constraint's local index along, looking it up afterwards
+        # with get_index() would scan the collection per constraint
         mapping = {}
-        for c in context.scene.sketcher.constraints.all:
-            if not hasattr(c, "placements"):
-                continue
+        for data_coll in context.scene.sketcher.constraints.get_lists():
+            for index, c in enumerate(data_coll):
+                if not hasattr(c, "placements"):
+                    continue
 
-            for e in c.placements():
-                if not mapping.get(e):
-                    mapping[e] = [c,]
-                else:
-                    mapping[e].append(c)
+                for e in c.placements():
+                    mapping.setdefault(e, []).append((c, index))
 
         for e, constrs in mapping.items():
             if not hasattr(e, "placement"):
@@ -754,12 +757,12 @@ class VIEW3D_GGT_slvs_constraint(GizmoGroup):
                 continue
 
             active_sketch = context.scene.sketcher.active_sketch
-            for i, c in enumerate(constrs):
+            for i, (c, index) in enumerate(constrs):
                 if not c.is_active(active_sketch):
                     continue
                 gz = self.gizmos.new(VIEW3D_GT_slvs_constraint.bl_idname)
                 gz.type = c.type
-                gz.index = context.scene.sketcher.constraints.get_index(c)
+                gz.index = index
 
                 pos = functions.get_2d_coords(context, e.placement())
 
@@ -786,12 +789,11 @@ class VIEW3D_GGT_slvs_constraint(GizmoGroup):
                 props.highlight_members = True
 
         # Add value gizmos for dimensional constraints
-        for c in iter_dimenional_constraints(context):
+        for c, index in iter_dimenional_constraints(context):
             if not c.is_active(context.scene.sketcher.active_sketch):
                 continue
 
             gz = self.gizmos.new(VIEW3D_GT_slvs_constraint_value.bl_idname)
-            index = context.scene.sketcher.constraints.get_index(c)
             gz.type = c.type
             gz.index = index
 
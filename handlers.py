@@ -61,9 +61,16 @@ def unregister_handlers():
 
 def _setup_builtin_handlers():
     from .versioning import write_addon_version, do_versioning
+    from .utilities.data_handling import invalidate_deps_cache_handler
     add_builtin_handler("version_update", do_versioning)
     add_builtin_handler("save_pre", write_addon_version)
 
+    # The cached dependency maps only track python-side mutations,
+    # undo/redo and file load change the data behind their back
+    add_builtin_handler("undo_post", invalidate_deps_cache_handler)
+    add_builtin_handler("redo_post", invalidate_deps_cache_handler)
+    add_builtin_handler("load_post", invalidate_deps_cache_handler)
+
 def register():
     _setup_builtin_handlers()
     register_handlers()
@@ -1,7 +1,7 @@
 from ..utilities.register import module_register_factory
 from ..stateful_operator.utilities.register import register_stateops_factory
 
-modules = [
+modules = (
     "select",
     "context_menu",
     "solver_state",
@@ -30,7 +30,7 @@ modules = [
     "add_diameter",
     "add_angle",
     "add_geometric_constraints",
-]
+)
 
 def _register_unregister_extern():
     """Imports and registers externally defined operators"""
@@ -41,12 +41,23 @@ def _register_unregister_extern():
     return register_stateops_factory(classes)
 
 _register, _unregister = module_register_factory(__name__, modules)
-_register_ext, _unregister_ext = _register_unregister_extern()
+
+# NOTE: The external operator modules are only imported once register()
+# actually runs, cache the factory result across register cycles
+_extern_factory = None
+
+def _get_extern_factory():
+    global _extern_factory
+    if _extern_factory is None:
+        _extern_factory = _register_unregister_extern()
+    return _extern_factory
 
 def register():
     _register()
-    _register_ext()
+    register_ext, _ = _get_extern_factory()
+    register_ext()
 
 def unregister():
-    _unregister_ext()
+    _, unregister_ext = _get_extern_factory()
+    unregister_ext()
     _unregister()
\ No newline at end of file
@@ -22,11 +22,10 @@ class GenericConstraintOp(GenericEntityOp):
         cls = SlvsConstraints.cls_from_type(self.type)
         entities = [None] * len(cls.signature)
         for i, name in enumerate(self._entity_prop_names):
-            if hasattr(self, name):
-                e = getattr(self, name)
-                if not e:
-                    continue
-                entities[i] = e
+            e = getattr(self, name, None)
+            if not e:
+                continue
+            entities[i] = e
         return entities
 
     @classmethod
@@ -77,10 +76,11 @@ class GenericConstraintOp(GenericEntityOp):
         args = []
         # fill in entities!
         for prop in self._entity_prop_names:
-            if hasattr(c, prop):
-                value = getattr(self, prop)
-                setattr(c, prop, value)
-                args.append(value)
+            if not hasattr(c, prop):
+                continue
+            value = getattr(self, prop)
+            setattr(c, prop, value)
+            args.append(value)
         return args
 
     def main(self, context: Context):
@@ -7,6 +7,22 @@ from ..utilities.highlighting import HighlightElement
 from ..declarations import Operators
 
 
+def show_context_menu(context: Context, element):
+    """Open a popup showing the element's settings. Callable directly to
+    avoid the operator dispatch overhead of bpy.ops"""
+
+    def draw_context_menu(self, context: Context):
+        col = self.layout.column()
+
+        if not element:
+            col.label(text="Nothing hovered")
+            return
+
+        element.draw_props(col)
+
+    context.window_manager.popup_menu(draw_context_menu)
+
+
 class View3D_OT_slvs_context_menu(Operator, HighlightElement):
     """Show element's settings"""
 
@@ -37,17 +53,12 @@ class View3D_OT_slvs_context_menu(Operator, HighlightElement):
         return {"RUNNING_MODAL"}
 
     def execute(self, context: Context):
-        is_entity = True
-        entity_index = None
-        constraint_index = None
         element = None
 
         # Constraints
         if self.properties.is_property_set("type"):
-            constraint_index = self.index
             constraints = context.scene.sketcher.constraints
             element = constraints.get_from_type_index(self.type, self.index)
-            is_entity = False
         else:
             # Entities
             entity_index = (
@@ -59,16 +70,7 @@ class View3D_OT_slvs_context_menu(Operator, HighlightElement):
             if entity_index != -1:
                 element = context.scene.sketcher.entities.get(entity_index)
 
-        def draw_context_menu(self, context: Context):
-            col = self.layout.column()
-
-            if not element:
-                col.label(text="Nothing hovered")
-                return
-
-            element.draw_props(col)
-
-        context.window_manager.popup_menu(draw_context_menu)
+        show_context_menu(context, element)
         return {"FINISHED"}
 
 register, unregister = register_classes_factory((View3D_OT_slvs_context_menu,))
\ No newline at end of file
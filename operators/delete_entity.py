@@ -86,7 +86,7 @@ class View3D_OT_slvs_delete_entity(Operator, HighlightElement):
 
         logger.debug("Delete: {}".format(entity))
         entities = context.scene.sketcher.entities
-        entities.remove(entity.slvs_index)
+        return entities.remove(entity.slvs_index)
 
     def execute(self, context: Context):
         index = self.index
@@ -100,18 +100,36 @@ class View3D_OT_slvs_delete_entity(Operator, HighlightElement):
             self.main(context, selected[0].slvs_index, self)
         else:
             # Batch deletion
-            indices = []
-            for e in selected:
-                indices.append(e.slvs_index)
-
+            entities = context.scene.sketcher.entities
+            indices = [e.slvs_index for e in selected]
             indices.sort(reverse=True)
-            for i in indices:
-                e = context.scene.sketcher.entities.get(i)
 
-                # NOTE: this might be slow when a lot of entities are selected, improve!
-                if is_entity_dependency(e, context):
-                    continue
-                self.delete(e, context)
+            # Deleting invalidates the dependency caches, so check all
+            # remaining entities first and delete afterwards. The caches are
+            # then rebuilt once per pass instead of once per deleted entity,
+            # additional passes pick up entities whose dependents were
+            # deleted in the previous one.
+            while indices:
+                deletable = [
+                    i
+                    for i in indices
+                    if not is_entity_dependency(entities.get(i), context)
+                ]
+                if not deletable:
+                    break
+
+                # Removal moves a collection's last element into the freed
+                # slot and reassigns its slvs_index, remap the surviving
+                # indices the same way. The selection state can't be used
+                # to track survivors, update_pointers purges it wholesale.
+                remaining = set(indices).difference(deletable)
+                for i in deletable:
+                    moved_index = self.delete(entities.get(i), context)
+                    if moved_index in remaining:
+                        remaining.remove(moved_index)
+                        remaining.add(i)
+
+                indices = sorted(remaining, reverse=True)
 
         refresh(context)
         return {"FINISHED"}
@@ -12,14 +12,16 @@ class SKETCHER_OT_add_preset_theme(AddPresetBase, Operator):
     bl_label = "Add Theme Preset"
     preset_menu = "SKETCHER_MT_theme_presets"
 
-    preset_defines = [
+    # NOTE: These have to stay plain source strings, AddPresetBase both
+    # execs them and writes them verbatim into the saved preset file
+    preset_defines = (
         'prefs = bpy.context.preferences.addons["CAD_Sketcher"].preferences',
         "theme = prefs.theme_settings",
         "entity = theme.entity",
         "constraint = theme.constraint",
-    ]
+    )
 
-    preset_values = [
+    preset_values = (
         "entity.default",
         "entity.highlight",
         "entity.selected",
@@ -31,7 +33,7 @@ class SKETCHER_OT_add_preset_theme(AddPresetBase, Operator):
         "constraint.failed",
         "constraint.failed_highlight",
         "constraint.text",
-    ]
+    )
 
     preset_subdir = "bgs/theme"
 
@@ -1,5 +1,6 @@
 import logging
 
+import numpy as np
 from bpy.types import Operator, Context
 from bpy.props import FloatProperty
 
@@ -15,6 +16,37 @@ logger = logging.getLogger(__name__)
 
 from ..utilities.trimming import TrimSegment
 
+# Below this number of candidates a plain loop is cheaper than
+# setting up the vectorized test
+BBOX_FILTER_MIN_CANDIDATES = 32
+
+
+def _aabb_overlap(a, b):
+    """Check if two (xmin, ymin, xmax, ymax) bounding boxes overlap"""
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _filter_overlapping(segment, entities):
+    """Return the entities whose bounding box overlaps the segment's bounding box"""
+    seg_bbox = segment.bbox()
+
+    if len(entities) < BBOX_FILTER_MIN_CANDIDATES:
+        return [e for e in entities if _aabb_overlap(seg_bbox, e.bbox())]
+
+    # Test all bounding boxes in one vectorized expression instead of
+    # comparing them in a python-level loop. Keep full precision so
+    # boundary-touching candidates classify the same as in the scalar path
+    xmin, ymin, xmax, ymax = seg_bbox
+    bboxes = np.array([e.bbox() for e in entities], dtype=np.float64)
+    mask = (
+        (bboxes[:, 0] <= xmax)
+        & (bboxes[:, 2] >= xmin)
+        & (bboxes[:, 1] <= ymax)
+        & (bboxes[:, 3] >= ymin)
+    )
+    return [e for e, overlaps in zip(entities, mask) if overlaps]
+
+
 class View3D_OT_slvs_trim(Operator, Operator2d):
     """Trim segment to its closest intersections"""
 
@@ -60,12 +92,17 @@ class View3D_OT_slvs_trim(Operator, Operator2d):
         trim = TrimSegment(segment, mouse_pos)
 
         # Find intersections
-        for e in sketch.sketch_entities(context):
-            if not type(e) in class_defines.segment:
-                continue
-            if e == segment:
-                continue
+        candidates = [
+            e
+            for e in sketch.sketch_entities(context)
+            if type(e) in class_defines.segment_types and e != segment
+        ]
+
+        # The exact intersection test is expensive, filter candidates that
+        # cannot intersect by their bounding boxes first
+        candidates = _filter_overlapping(segment, candidates)
 
+        for e in candidates:
             for co in segment.intersect(e):
                 # print("intersect", co)
                 trim.add(e, co)
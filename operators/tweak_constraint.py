@@ -1,4 +1,3 @@
-import bpy
 from bpy.utils import register_classes_factory
 from bpy.props import IntProperty, StringProperty
 from bpy.types import Operator, Context, Event
@@ -7,6 +6,7 @@ from mathutils.geometry import intersect_line_plane
 
 from .. import functions
 from ..declarations import Operators
+from .context_menu import show_context_menu
 
 
 class View3D_OT_slvs_tweak_constraint_value_pos(Operator):
@@ -20,6 +20,7 @@ class View3D_OT_slvs_tweak_constraint_value_pos(Operator):
 
     def invoke(self, context: Context, event: Event):
         self.tweak = False
+        self.tweak_cache = None
         self.init_mouse_pos = Vector((event.mouse_region_x, event.mouse_region_y))
         context.window_manager.modal_handler_add(self)
         return {"RUNNING_MODAL"}
@@ -41,21 +42,30 @@ class View3D_OT_slvs_tweak_constraint_value_pos(Operator):
 
         coords = event.mouse_region_x, event.mouse_region_y
 
-        constraints = context.scene.sketcher.constraints
-        constr = constraints.get_from_type_index(self.type, self.index)
+        # The entities the constraint is attached to don't move while
+        # dragging, resolve the constraint and its transforms only once
+        if self.tweak_cache is None:
+            constraints = context.scene.sketcher.constraints
+            constr = constraints.get_from_type_index(self.type, self.index)
+            self.tweak_cache = (
+                constr,
+                constr.draw_plane(),
+                constr.matrix_basis().inverted(),
+            )
+        constr, draw_plane, mat_inv = self.tweak_cache
 
         origin, end_point = functions.get_picking_origin_end(context, coords)
-        pos = intersect_line_plane(origin, end_point, *constr.draw_plane())
-
-        mat = constr.matrix_basis()
-        pos = mat.inverted() @ pos
+        pos = intersect_line_plane(origin, end_point, *draw_plane)
+        pos = mat_inv @ pos
 
         constr.update_draw_offset(pos, context.preferences.system.ui_scale)
         context.space_data.show_gizmo = True
         return {"RUNNING_MODAL"}
 
     def execute(self, context: Context):
-        bpy.ops.view3d.slvs_context_menu(type=self.type, index=self.index)
+        constraints = context.scene.sketcher.constraints
+        constr = constraints.get_from_type_index(self.type, self.index)
+        show_context_menu(context, constr)
         return {"FINISHED"}
 
 register, unregister = register_classes_factory((View3D_OT_slvs_tweak_constraint_value_pos,))
\ No newline at end of file
@@ -1,10 +1,10 @@
 from .utilities.register import module_register_factory
 
-base_modules = [
+base_modules = (
     "base",
-]
+)
 
-core_modules = [
+core_modules = (
     "handlers",
     "class_defines",
     "operators",
@@ -13,7 +13,7 @@ core_modules = [
     "workspacetools",
     "ui",
     "draw_handler",
-]
+)
 
 register_base, unregister_base = module_register_factory(__package__, base_modules)
 register_full, unregister_full = module_register_factory(__package__, core_modules)
@@ -1,20 +1,31 @@
-from typing import Type, List
+from typing import Type, List, Tuple
 
 from bpy.utils import register_class, unregister_class
 
 from ..logic import StatefulOperatorLogic
 
-def _register_stateop(cls: Type[StatefulOperatorLogic]):
-    if hasattr(cls, "register_properties"):
-        cls.register_properties()
-    register_class(cls)
+def _prepare_stateops(classes) -> Tuple:
+    """Resolve the optional register_properties hook per class once,
+    the register path runs on every addon enable/reload"""
+    return tuple((cls, getattr(cls, "register_properties", None)) for cls in classes)
 
 def register_stateops_factory(classes: List[Type[StatefulOperatorLogic]]):
+    prepared = _prepare_stateops(classes)
+
     def register():
-        for cls in classes:
-            _register_stateop(cls)
+        # Bind to a local, avoids the global lookup per iteration
+        _register_class = register_class
+        for cls, register_properties in prepared:
+            if register_properties is not None:
+                register_properties()
+            _register_class(cls)
 
     def unregister():
+        _unregister_class = unregister_class
         for cls in reversed(classes):
-            unregister_class(cls)
-    return register, unregister
\ No newline at end of file
+            # Guard against double-unregister, e.g. when Blender tears down
+            # a partially registered addon
+            if not getattr(cls, "is_registered", False):
+                continue
+            _unregister_class(cls)
+    return register, unregister
@@ -1,5 +1,5 @@
-from collections import deque
-from typing import Generator, Deque
+from collections import defaultdict
+from typing import Generator, List, Tuple
 
 from bpy.types import Scene, Context
 
@@ -18,16 +18,20 @@ def to_list(value):
 def get_flat_deps(entity):
     """Return flattened list of entities given entity depends on"""
     list = []
+    # Track visited entities by index, membership tests on the list itself
+    # are O(n) and compare via RNA
+    seen = set()
 
     def walker(entity, is_root=False):
-        if entity in list:
+        if entity.slvs_index in seen:
             return
         if not is_root:
+            seen.add(entity.slvs_index)
             list.append(entity)
         if not hasattr(entity, "dependencies"):
             return
         for e in entity.dependencies():
-            if e in list:
+            if e.slvs_index in seen:
                 continue
             walker(e)
 
@@ -35,6 +39,41 @@ def get_flat_deps(entity):
     return list
 
 
+# Inverted index of direct entity dependencies, maps an entity's slvs_index
+# to the indices of the entities which directly depend on it, keyed by scene
+# since slvs_index spaces overlap between scenes. Entity indices get recycled
+# on removal so the index has to be invalidated whenever entities or
+# constraints mutate.
+_dependents_map = {}
+
+# Maps an entity's slvs_index to the constraints which reference it,
+# invalidated together with the dependents map
+_constraint_refs = {}
+
+
+def invalidate_deps_cache():
+    """Drop cached dependency data, has to be called whenever entities or
+    constraints are added or removed"""
+    _dependents_map.clear()
+    _constraint_refs.clear()
+
+
+def invalidate_deps_cache_handler(*args):
+    """bpy.app handler callback, python-side mutation hooks don't run on
+    undo/redo or file load so the cached maps are stale afterwards"""
+    invalidate_deps_cache()
+
+
+def _get_dependents_map(scene: Scene):
+    dependents = _dependents_map.get(scene.name_full)
+    if dependents is None:
+        dependents = _dependents_map[scene.name_full] = defaultdict(set)
+        for scene_entity in get_scene_entities(scene):
+            for dep in scene_entity.dependencies():
+                dependents[dep.slvs_index].add(scene_entity.slvs_index)
+    return dependents
+
+
 def get_scene_constraints(scene: Scene):
     return scene.sketcher.constraints.all
 
@@ -46,16 +85,36 @@ def get_scene_entities(scene: Scene):
 def get_entity_deps(
     entity: SlvsGenericEntity, context: Context
 ) -> Generator[SlvsGenericEntity, None, None]:
-    for scene_entity in get_scene_entities(context.scene):
-        deps = set(get_flat_deps(scene_entity))
-        if entity in deps:
-            yield scene_entity
+    """Yield the entities which depend on entity, directly or transitively"""
+    entities = context.scene.sketcher.entities
+    dependents = _get_dependents_map(context.scene)
+
+    visited = set()
+    stack = [entity.slvs_index]
+    while stack:
+        index = stack.pop()
+        for dependent_index in dependents.get(index, ()):
+            if dependent_index in visited:
+                continue
+            visited.add(dependent_index)
+            stack.append(dependent_index)
+            yield entities.get(dependent_index)
+
+def _get_constraint_refs(scene: Scene):
+    refs = _constraint_refs.get(scene.name_full)
+    if refs is None:
+        refs = _constraint_refs[scene.name_full] = defaultdict(list)
+        for c in get_scene_constraints(scene):
+            for e in c.dependencies():
+                refs[e.slvs_index].append(c)
+    return refs
 
 def _is_referenced_by_constraint(entity, context):
-    for c in context.scene.sketcher.constraints.all:
-        if entity in c.dependencies():
-            return True
-    return False
+    return entity.slvs_index in _get_constraint_refs(context.scene)
+
+def get_entity_constraints(entity: SlvsGenericEntity, context: Context):
+    """Return the constraints which reference the given entity"""
+    return _get_constraint_refs(context.scene).get(entity.slvs_index, [])
 
 def is_entity_dependency(entity: SlvsGenericEntity, context: Context) -> bool:
     """Check if entity is a dependency of another entity"""
@@ -74,8 +133,8 @@ def is_entity_referenced(entity: SlvsGenericEntity, context: Context) -> bool:
         return True
     return False
 
-def get_sketch_deps_indicies(sketch: SlvsSketch, context: Context):
-    deps = deque()
+def get_sketch_deps_indicies(sketch: SlvsSketch, context: Context) -> List[int]:
+    deps = []
     for entity in get_scene_entities(context.scene):
         if not hasattr(entity, "sketch_i"):
             continue
@@ -87,14 +146,16 @@ def get_sketch_deps_indicies(sketch: SlvsSketch, context: Context):
 
 def get_constraint_local_indices(
     entity: SlvsGenericEntity, context: Context
-) -> Deque[int]:
+) -> List[Tuple[object, List[int]]]:
     constraints = context.scene.sketcher.constraints
-    ret_list = deque()
+    ret_list = []
 
     for data_coll in constraints.get_lists():
-        indices = deque()
-        for c in data_coll:
+        indices = []
+        # The local index is simply the constraint's position in its
+        # collection, no need to look it up with constraints.get_index()
+        for i, c in enumerate(data_coll):
             if entity in c.dependencies():
-                indices.append(constraints.get_index(c))
+                indices.append(i)
         ret_list.append((data_coll, indices))
     return ret_list
@@ -1,5 +1,6 @@
 import bpy
 
+import functools
 import os
 import sys
 
@@ -12,11 +13,14 @@ def cleanse_modules(parent_module_name):
             del sys.modules[module_name]
 
 
-
+# NOTE: Cached, the addon location doesn't change at runtime but these get
+# called on every preferences access
+@functools.lru_cache(maxsize=None)
 def get_path():
     return os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 
 
+@functools.lru_cache(maxsize=None)
 def get_name():
     return os.path.basename(get_path())
 
@@ -26,16 +30,31 @@ import importlib
 from traceback import print_exc
 # Similar to bpy.utils.register_submodule_factory
 def module_register_factory(parent_module_name: str, module_names: List[str]):
-    modules = [importlib.import_module(f"{parent_module_name}.{name}") for name in module_names]
+    # NOTE: Import lazily on first register, importing the whole module graph
+    # at addon import time slows down cold start and isn't needed when only
+    # the base modules get registered
+    modules = None
+
+    def _get_modules():
+        nonlocal modules
+        if modules is None:
+            modules = [
+                importlib.import_module(f"{parent_module_name}.{name}")
+                for name in module_names
+            ]
+        return modules
 
     def register():
-        for m in modules:
+        for m in _get_modules():
             try:
                 m.register()
             except Exception:
                 print_exc()
 
     def unregister():
+        if modules is None:
+            # Nothing was ever registered
+            return
         for m in reversed(modules):
             try:
                 m.unregister()
@@ -1,16 +1,26 @@
 import logging
 
-import bpy
 from bpy.types import Context
 
 from .. import class_defines
+from ..solver import solve_system
+from .data_handling import (
+    get_entity_constraints,
+    invalidate_deps_cache,
+    is_entity_dependency,
+)
 
 logger = logging.getLogger(__name__)
 
+# Constraint types that cannot simply be copied to the new sub-segments
+SKIP_CONSTRAINT_TYPES = frozenset(("RATIO", "COINCIDENT", "MIDPOINT", "TANGENT"))
+
 
 class Intersection:
     """Either a intersection between the segment to be trimmed and specified entity or a segment endpoint"""
 
+    __slots__ = ("element", "co", "index", "_is_endpoint", "_point")
+
     def __init__(self, element, co):
         # Either a intersecting entity, a segment endpoint or a coincident/midpoint constraint
         self.element = element
@@ -28,6 +38,14 @@ class Intersection:
     def is_endpoint(self):
         return self._is_endpoint
 
+    def has_point(self):
+        """Check if a point can be returned without implicitly creating one"""
+        if self.is_entity() and self.element.is_point():
+            return True
+        if self.is_constraint():
+            return True
+        return self._point is not None
+
     def get_point(self, context: Context):
         if self.is_entity() and self.element.is_point():
             return self.element
@@ -57,9 +75,10 @@ class TrimSegment:
         self.segment = segment
         self.pos = pos
         self._intersections = []
+        self._sorted_intersections = None
         self._is_closed = segment.is_closed()
         self.connection_points = segment.connection_points().copy()
-        self.obsolete_intersections = []
+        self.obsolete_intersections = set()
         self.reuse_segment = False
 
         # Add connection points as intersections
@@ -71,6 +90,7 @@ class TrimSegment:
     def add(self, element, co):
         intr = Intersection(element, co)
         self._intersections.append(intr)
+        self._sorted_intersections = None
         return intr
 
     def check(self):
@@ -78,11 +98,18 @@ class TrimSegment:
         return len(relevant) in (2, 4)
 
     def _sorted(self):
-        # Return intersections sorted by distance from mousepos
-        return sorted(
-            self._intersections,
-            key=lambda intr: self.segment.distance_along_segment(self.pos, intr.co),
-        )
+        # Return intersections sorted by distance from mousepos.
+        # NOTE: sorted() evaluates the key only once per element, caching
+        # the result avoids recomputing distance_along_segment when the
+        # ordering is requested multiple times (check, ensure_points, replace)
+        if self._sorted_intersections is None:
+            self._sorted_intersections = sorted(
+                self._intersections,
+                key=lambda intr: self.segment.distance_along_segment(
+                    self.pos, intr.co
+                ),
+            )
+        return self._sorted_intersections
 
     def get_intersections(self):
         # Return intersections in order starting from startpoint
@@ -103,15 +130,13 @@ class TrimSegment:
                 # Add endpoints
                 if intr.index in closest:
                     # Not if next to trim segment
-                    if intr not in self.obsolete_intersections:
-                        self.obsolete_intersections.append(intr)
+                    self.obsolete_intersections.add(intr)
                     continue
                 relevant.append(intr)
 
             if intr.index in closest:
                 if intr.is_constraint():
-                    if intr not in self.obsolete_intersections:
-                        self.obsolete_intersections.append(intr)
+                    self.obsolete_intersections.add(intr)
                 relevant.append(intr)
 
         def _get_log_msg():
@@ -125,26 +150,37 @@ class TrimSegment:
         return relevant
 
     def ensure_points(self, context: Context):
+        """Get the point of all relevant intersections, creating missing ones.
+        Returns whether any point had to be created"""
+        created = False
         for intr in self.relevant_intersections():
+            if not intr.has_point():
+                created = True
             intr.get_point(context)
+        return created
 
     def replace(self, context: Context):
+        # NOTE: Import locally to avoid a circular module dependency
+        from ..operators.delete_entity import View3D_OT_slvs_delete_entity
+
         relevant = self.relevant_intersections()
 
-        # Get constraints
+        # Get constraints, remember at which position they reference the segment
         constrs = {}
-        for c in context.scene.sketcher.constraints.all:
+        for c in get_entity_constraints(self.segment, context):
             entities = c.entities()
             if not self.segment in entities:
                 continue
-            constrs[c] = entities
+            constrs[c] = (entities, entities.index(self.segment))
 
         # Note: this seems to be needed, explicitly add all points and update viewlayer before starting to replace segments
-        self.ensure_points(context)
+        points_created = self.ensure_points(context)
 
         # NOTE: This is needed for some reason, otherwise there's a bug where
-        # a point is suddenly interpreted as a line
-        context.view_layer.update()
+        # a point is suddenly interpreted as a line. A full depsgraph update
+        # is expensive, only flush when points were actually added
+        if points_created:
+            context.view_layer.update()
 
         # Create new segments
         segment_count = len(relevant) // 2
@@ -170,17 +206,24 @@ class TrimSegment:
                 continue
 
             # Copy constraints to new segment
-            for c, ents in constrs.items():
-                i = ents.index(self.segment)
+            for c, (ents, i) in constrs.items():
                 if index != 0:
-                    if c.type in ("RATIO", "COINCIDENT", "MIDPOINT", "TANGENT"):
+                    if c.type in SKIP_CONSTRAINT_TYPES:
                         continue
                     ents[i] = new_segment
                     new_constr = c.copy(context, ents)
                 else:
                     # if the original segment doesn't get reused the original constraints
                     # have to be remapped to the new segment
-                    setattr(c, "entity{}_i".format(i + 1), new_segment.slvs_index)
+                    setattr(
+                        c,
+                        class_defines.ENTITY_INDEX_PROP_NAMES[i],
+                        new_segment.slvs_index,
+                    )
+
+        # Remapping writes the index properties directly which bypasses the
+        # entity pointer setters, invalidate the dependency caches explicitly
+        invalidate_deps_cache()
 
         def _get_msg_obsolete():
             msg = "Remove obsolete intersections:"
@@ -191,17 +234,24 @@ class TrimSegment:
         logger.debug(_get_msg_obsolete())
 
         # Remove unused endpoints
-        delete_constraints = []
+        constraints = context.scene.sketcher.constraints
+        constraint_removed = False
         for intr in self.obsolete_intersections:
             if intr.is_constraint():
-                c = intr.element
-                i = context.scene.sketcher.constraints.get_index(c)
-                # TODO: Make this a class reference
-                bpy.ops.view3d.slvs_delete_constraint(type=c.type, index=i)
+                logger.debug("Delete: {}".format(intr.element))
+                constraints.remove(intr.element)
+                constraint_removed = True
             if intr.is_entity():
-                # Use operator which checks if other entities depend on this and auto deletes constraints
-                # TODO: Make this a class reference
-                bpy.ops.view3d.slvs_delete_entity(index=intr.element.slvs_index, do_report=False)
+                # Deleting directly also removes constraints which depend on
+                # the entity, keep the dependency check the operator would
+                # otherwise perform
+                if not is_entity_dependency(intr.element, context):
+                    View3D_OT_slvs_delete_entity.delete(intr.element, context)
+
+        # Solve once after all obsolete constraints are gone instead of
+        # per deleted constraint
+        if constraint_removed:
+            solve_system(context, sketch=context.scene.sketcher.active_sketch)
 
         # Remove original segment if not used
         if not self.reuse_segment: